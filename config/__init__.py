@@ -2,6 +2,6 @@
 Configuration module for Zendesk Email Exporter
 """
 
-from .settings import config, ZendeskConfig
+from .settings import get_config, ZendeskConfig
 
-__all__ = ['config', 'ZendeskConfig']
\ No newline at end of file
+__all__ = ['get_config', 'ZendeskConfig']
\ No newline at end of file
@@ -8,9 +8,11 @@ from typing import Optional
 from dotenv import load_dotenv
 import logging
 
-# Load environment variables from .env file
+# Load environment variables from .env file (once per process tree)
 env_path = Path(__file__).parent.parent / '.env'
-load_dotenv(dotenv_path=env_path)
+if not os.environ.get('_ZENDESK_DOTENV_LOADED'):
+    load_dotenv(dotenv_path=env_path, override=False)
+    os.environ['_ZENDESK_DOTENV_LOADED'] = '1'
 
 # Logger configuration
 LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
@@ -22,6 +24,14 @@ logging.basicConfig(
 class ZendeskConfig:
     """Configuration class for Zendesk API settings"""
     
+    # Fixed attribute layout; the config is read on every API request
+    __slots__ = (
+        'email', 'api_token', 'subdomain', 'base_url', 'endpoints',
+        'timeout', 'max_retries', 'retry_delay', 'page_size',
+        'rate_limit_requests', 'rate_limit_window', 'default_group_id',
+        'output_dir', '_auth', '_headers'
+    )
+    
     def __init__(self):
         # API Credentials
         self.email = os.getenv('ZENDESK_EMAIL')
@@ -64,20 +74,29 @@ class ZendeskConfig:
         
         # Output settings
         self.output_dir = Path(os.getenv('OUTPUT_DIR', './output'))
-        self.output_dir.mkdir(exist_ok=True)
+        
+        # Request auth and headers are fixed for the lifetime of the config
+        self._auth = (f"{self.email}/token", self.api_token)
+        self._headers = {
+            'Content-Type': 'application/json',
+            'Accept': 'application/json'
+        }
     
     @property
     def auth(self) -> tuple:
         """Return authentication tuple for requests"""
-        return (f"{self.email}/token", self.api_token)
+        return self._auth
     
     @property
     def headers(self) -> dict:
         """Return default headers for API requests"""
-        return {
-            'Content-Type': 'application/json',
-            'Accept': 'application/json'
-        }
+        return self._headers
+    
+    def ensure_output_dir(self) -> Path:
+        """Create the output directory if needed and return it"""
+        if not self.output_dir.exists():
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+        return self.output_dir
     
     def get_endpoint(self, endpoint_name: str, **kwargs) -> str:
         """Get formatted endpoint URL"""
@@ -94,5 +113,13 @@ class ZendeskConfig:
         )
 
 
-# Create a singleton config instance
-config = ZendeskConfig()
\ No newline at end of file
+# Singleton config instance, created on first use
+_config: Optional[ZendeskConfig] = None
+
+
+def get_config() -> ZendeskConfig:
+    """Return the shared ZendeskConfig, creating it on first call"""
+    global _config
+    if _config is None:
+        _config = ZendeskConfig()
+    return _config
@@ -2,17 +2,42 @@
 Module for extracting email addresses from Zendesk tickets
 """
 
+import heapq
 import logging
 import re
-from typing import List, Dict, Any, Set, Optional
-from collections import defaultdict
-import validators
+from bisect import bisect_right
+from functools import lru_cache
+from sys import intern
+from typing import List, Dict, Any, Set, Optional, Iterable
 from rich.console import Console
-from rich.table import Table
 
 logger = logging.getLogger(__name__)
 console = Console()
 
+# Bit flags recording where an email was found
+_SOURCE_REQUESTER = 1
+_SOURCE_CC = 2
+_SOURCE_COMMENT = 4
+_SOURCE_MASKS = {
+    'requester': _SOURCE_REQUESTER,
+    'cc': _SOURCE_CC,
+    'comment': _SOURCE_COMMENT
+}
+
+# Free-text fields are joined with this separator and scanned in batches
+# of roughly this many characters
+_TEXT_SEPARATOR = '\x1f'
+_SCAN_BATCH_CHARS = 1 << 20
+
+# Pattern for validating a single, complete email address
+_EMAIL_RE = re.compile(r'^[A-Za-z0-9._%+\-]+@[A-Za-z0-9.\-]+\.[A-Za-z]{2,}$', re.ASCII)
+
+
+@lru_cache(maxsize=100_000)
+def _validate_email_cached(email: str) -> bool:
+    """Validate a normalized email address, memoized across tickets"""
+    return len(email) <= 254 and _EMAIL_RE.fullmatch(email) is not None
+
 
 class EmailExtractor:
     """Class for extracting email addresses from Zendesk tickets"""
@@ -21,64 +46,145 @@ class EmailExtractor:
         """Initialize email extractor"""
         # Email regex pattern for finding emails in text
         self.email_pattern = re.compile(
-            r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+            r'\b[A-Za-z0-9._%+\-]+@[A-Za-z0-9.\-]+\.[A-Za-z]{2,}\b',
+            re.ASCII
         )
     
     def extract_from_tickets(
         self, 
-        tickets: List[Dict[str, Any]],
+        tickets: Iterable[Dict[str, Any]],
         include_ccs: bool = True,
         include_comments: bool = False
     ) -> Dict[str, Dict[str, Any]]:
         """
-        Extract email addresses from a list of tickets
+        Extract email addresses from tickets
+        
+        Tickets are consumed one at a time, so any iterable (including a
+        generator) can be passed.
         
         Args:
-            tickets: List of ticket dictionaries
+            tickets: Iterable of ticket dictionaries
             include_ccs: Whether to include CC email addresses
             include_comments: Whether to extract emails from comments
             
         Returns:
             Dictionary with email as key and metadata as value
         """
-        email_data = defaultdict(lambda: {
-            'ticket_ids': [],
-            'ticket_count': 0,
-            'first_seen': None,
-            'last_seen': None,
-            'is_requester': False,
-            'is_cc': False,
-            'is_from_comment': False
-        })
+        # Column-oriented accumulators keyed by email; assembled into the
+        # per-email dictionaries once all tickets have been processed
+        columns = ({}, {}, {}, {})
+        
+        # Free-text values are queued and scanned for emails in batches
+        texts = []
+        owners = []
+        pending_chars = 0
         
         for ticket in tickets:
+            ticket_id = ticket.get('id')
+            created_at = ticket.get('created_at')
+            
             # Extract requester email
             requester_email = self._extract_requester_email(ticket)
             if requester_email:
-                self._add_email(email_data, requester_email, ticket, 'requester')
+                self._add_email(columns, requester_email, ticket_id, created_at, 'requester')
             
             # Extract CC emails
             if include_ccs:
                 cc_emails = self._extract_cc_emails(ticket)
                 for cc_email in cc_emails:
-                    self._add_email(email_data, cc_email, ticket, 'cc')
+                    self._add_email(columns, cc_email, ticket_id, created_at, 'cc')
             
-            # Extract emails from custom fields
-            custom_emails = self._extract_custom_field_emails(ticket)
-            for custom_email in custom_emails:
-                self._add_email(email_data, custom_email, ticket, 'custom_field')
+            # Queue custom field values
+            queued = len(texts)
+            pending_chars += self._collect_custom_field_texts(ticket, texts)
+            owners.extend([(ticket_id, created_at, 'custom_field')] * (len(texts) - queued))
             
-            # Extract emails from comments if requested
+            # Queue comment bodies if requested
             if include_comments:
-                comment_emails = self._extract_comment_emails(ticket)
-                for comment_email in comment_emails:
-                    self._add_email(email_data, comment_email, ticket, 'comment')
+                queued = len(texts)
+                pending_chars += self._collect_comment_texts(ticket, texts)
+                owners.extend([(ticket_id, created_at, 'comment')] * (len(texts) - queued))
+            
+            if pending_chars >= _SCAN_BATCH_CHARS:
+                self._scan_texts(columns, texts, owners)
+                pending_chars = 0
+        
+        self._scan_texts(columns, texts, owners)
+        
+        return self._build_email_data(columns)
+    
+    def extract_from_ticket_groups(
+        self,
+        ticket_groups: List[List[Dict[str, Any]]],
+        include_ccs: bool = True,
+        include_comments: bool = False
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Extract email addresses from several ticket lists
+        
+        Each list (typically one per group) is extracted in-process and the
+        per-list results are merged. Extraction only reads a few fields per
+        ticket, so shipping whole tickets to worker processes costs more in
+        pickling than the extraction itself.
+        
+        Args:
+            ticket_groups: List of ticket lists
+            include_ccs: Whether to include CC email addresses
+            include_comments: Whether to extract emails from comments
+            
+        Returns:
+            Dictionary with email as key and metadata as value
+        """
+        return self.merge_email_data(
+            self.extract_from_tickets(tickets, include_ccs, include_comments)
+            for tickets in ticket_groups
+        )
+    
+    def merge_email_data(
+        self,
+        results: Iterable[Dict[str, Dict[str, Any]]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Merge email data dictionaries from separate extractions
         
-        return dict(email_data)
+        Args:
+            results: Email data dictionaries as returned by extract_from_tickets
+            
+        Returns:
+            Combined dictionary with email as key and metadata as value
+        """
+        merged = {}
+        for email_data in results:
+            for email, data in email_data.items():
+                current = merged.get(email)
+                if current is None:
+                    merged[email] = data
+                    continue
+                
+                ticket_ids = set(current['ticket_ids'])
+                ticket_ids.update(data['ticket_ids'])
+                current['ticket_ids'] = sorted(ticket_ids)
+                current['ticket_count'] = len(ticket_ids)
+                
+                # ISO-8601 strings of equal width order chronologically
+                if data['first_seen'] and (
+                    not current['first_seen'] or data['first_seen'] < current['first_seen']
+                ):
+                    current['first_seen'] = data['first_seen']
+                if data['last_seen'] and (
+                    not current['last_seen'] or data['last_seen'] > current['last_seen']
+                ):
+                    current['last_seen'] = data['last_seen']
+                
+                current['is_requester'] = current['is_requester'] or data['is_requester']
+                current['is_cc'] = current['is_cc'] or data['is_cc']
+                current['is_from_comment'] = current['is_from_comment'] or data['is_from_comment']
+        
+        return merged
     
     def get_unique_emails(
         self, 
-        tickets: List[Dict[str, Any]],
+        tickets: Iterable[Dict[str, Any]],
         include_ccs: bool = True,
         include_comments: bool = False
     ) -> Set[str]:
@@ -86,7 +192,7 @@ class EmailExtractor:
         Get unique set of email addresses from tickets
         
         Args:
-            tickets: List of ticket dictionaries
+            tickets: Iterable of ticket dictionaries
             include_ccs: Whether to include CC email addresses
             include_comments: Whether to extract emails from comments
             
@@ -115,27 +221,27 @@ class EmailExtractor:
                 'total_tickets': 0,
                 'requester_emails': 0,
                 'cc_emails': 0,
-                'comment_emails': 0
+                'comment_emails': 0,
+                'avg_tickets_per_email': 0
             }
         
-        requester_count = sum(1 for data in email_data.values() if data['is_requester'])
-        cc_count = sum(1 for data in email_data.values() if data['is_cc'])
-        comment_count = sum(1 for data in email_data.values() if data['is_from_comment'])
-        total_tickets = len(set(
-            ticket_id 
-            for data in email_data.values() 
-            for ticket_id in data['ticket_ids']
-        ))
+        # Single pass over the email data for all counters
+        requester_count = cc_count = comment_count = ticket_refs = 0
+        ticket_ids = set()
+        for data in email_data.values():
+            requester_count += data['is_requester']
+            cc_count += data['is_cc']
+            comment_count += data['is_from_comment']
+            ticket_refs += data['ticket_count']
+            ticket_ids.update(data['ticket_ids'])
         
         return {
             'total_unique_emails': len(email_data),
-            'total_tickets': total_tickets,
+            'total_tickets': len(ticket_ids),
             'requester_emails': requester_count,
             'cc_emails': cc_count,
             'comment_emails': comment_count,
-            'avg_tickets_per_email': round(
-                sum(data['ticket_count'] for data in email_data.values()) / len(email_data), 2
-            ) if email_data else 0
+            'avg_tickets_per_email': round(ticket_refs / len(email_data), 2)
         }
     
     def display_email_summary(self, email_data: Dict[str, Dict[str, Any]]):
@@ -144,22 +250,15 @@ class EmailExtractor:
             console.print("[yellow]No emails found[/yellow]")
             return
         
-        # Create table
-        table = Table(title="Extracted Emails Summary")
-        table.add_column("Email", style="cyan")
-        table.add_column("Tickets", style="green", justify="right")
-        table.add_column("Type", style="yellow")
-        table.add_column("First Seen", style="magenta")
-        
-        # Sort emails by ticket count
-        sorted_emails = sorted(
+        # Top 20 emails by ticket count
+        top_emails = heapq.nlargest(
+            20,
             email_data.items(),
-            key=lambda x: x[1]['ticket_count'],
-            reverse=True
+            key=lambda x: x[1]['ticket_count']
         )
         
-        # Display top 20 emails
-        for email, data in sorted_emails[:20]:
+        rows = []
+        for email, data in top_emails:
             email_type = []
             if data['is_requester']:
                 email_type.append("Requester")
@@ -172,17 +271,45 @@ class EmailExtractor:
             if first_seen:
                 first_seen = first_seen.split('T')[0]  # Extract date part
             
-            table.add_row(
+            rows.append((
                 email,
                 str(data['ticket_count']),
                 ", ".join(email_type),
                 first_seen or "N/A"
-            )
+            ))
+        
+        stats = self.get_email_statistics(email_data)
+        
+        # Plain tab-separated output when redirected (no rich rendering)
+        if not console.is_terminal:
+            lines = ["Email\tTickets\tType\tFirst Seen"]
+            lines.extend("\t".join(row) for row in rows)
+            lines.append("")
+            lines.append("Statistics:")
+            lines.append(f"Total unique emails: {stats['total_unique_emails']}")
+            lines.append(f"Total tickets: {stats['total_tickets']}")
+            lines.append(f"Requester emails: {stats['requester_emails']}")
+            lines.append(f"CC emails: {stats['cc_emails']}")
+            lines.append(f"Comment emails: {stats['comment_emails']}")
+            lines.append(f"Avg tickets per email: {stats['avg_tickets_per_email']}")
+            print("\n".join(lines))
+            return
+        
+        # Create table
+        from rich.table import Table
+        
+        table = Table(title="Extracted Emails Summary")
+        table.add_column("Email", style="cyan")
+        table.add_column("Tickets", style="green", justify="right")
+        table.add_column("Type", style="yellow")
+        table.add_column("First Seen", style="magenta")
+        
+        for row in rows:
+            table.add_row(*row)
         
         console.print(table)
         
         # Display statistics
-        stats = self.get_email_statistics(email_data)
         console.print("\n[bold cyan]Statistics:[/bold cyan]")
         console.print(f"Total unique emails: [green]{stats['total_unique_emails']}[/green]")
         console.print(f"Total tickets: [green]{stats['total_tickets']}[/green]")
@@ -194,24 +321,24 @@ class EmailExtractor:
     def _extract_requester_email(self, ticket: Dict[str, Any]) -> Optional[str]:
         """Extract requester email from ticket"""
         # Try different possible locations for requester email
-        requester_email = None
-        
         # Check via field
-        via = ticket.get('via', {})
-        source = via.get('source', {})
-        from_address = source.get('from', {})
-        if isinstance(from_address, dict):
-            requester_email = from_address.get('address')
+        try:
+            requester_email = ticket['via']['source']['from']['address']
+        except (KeyError, TypeError):
+            requester_email = None
         
         # Check requester_id and look up in users if available
-        if not requester_email and 'requester' in ticket:
-            requester = ticket['requester']
-            if isinstance(requester, dict):
-                requester_email = requester.get('email')
+        if not requester_email:
+            try:
+                requester_email = ticket['requester']['email']
+            except (KeyError, TypeError):
+                requester_email = None
         
         # Validate and return
-        if requester_email and self._validate_email(requester_email):
-            return requester_email.lower()
+        if requester_email:
+            requester_email = requester_email.lower()
+            if self._validate_email(requester_email):
+                return intern(requester_email)
         
         return None
     
@@ -222,109 +349,147 @@ class EmailExtractor:
         # Check email_cc field
         email_ccs = ticket.get('email_ccs', [])
         if email_ccs:
+            # Exact type checks: decoded JSON never contains dict/str subclasses
             for cc_entry in email_ccs:
-                if isinstance(cc_entry, dict):
+                entry_type = type(cc_entry)
+                if entry_type is dict:
                     email = cc_entry.get('email')
-                elif isinstance(cc_entry, str):
+                elif entry_type is str:
                     email = cc_entry
                 else:
                     continue
                 
-                if email and self._validate_email(email):
-                    cc_emails.add(email.lower())
+                if email:
+                    email = email.lower()
+                    if self._validate_email(email):
+                        cc_emails.add(intern(email))
         
         # Check collaborator_ids if present
         collaborators = ticket.get('collaborators', [])
         for collaborator in collaborators:
-            if isinstance(collaborator, dict):
+            if type(collaborator) is dict:
                 email = collaborator.get('email')
-                if email and self._validate_email(email):
-                    cc_emails.add(email.lower())
+                if email:
+                    email = email.lower()
+                    if self._validate_email(email):
+                        cc_emails.add(intern(email))
         
         return cc_emails
     
-    def _extract_custom_field_emails(self, ticket: Dict[str, Any]) -> Set[str]:
-        """Extract email addresses from custom fields"""
-        emails = set()
-        
-        # Check custom fields
-        custom_fields = ticket.get('custom_fields', [])
-        for field in custom_fields:
-            value = field.get('value')
-            if value and isinstance(value, str):
-                # Look for emails in the value
-                found_emails = self.email_pattern.findall(value)
-                for email in found_emails:
-                    if self._validate_email(email):
-                        emails.add(email.lower())
-        
-        # Check fields object
-        fields = ticket.get('fields', [])
-        for field in fields:
-            value = field.get('value')
-            if value and isinstance(value, str):
-                found_emails = self.email_pattern.findall(value)
-                for email in found_emails:
-                    if self._validate_email(email):
-                        emails.add(email.lower())
+    def _collect_custom_field_texts(self, ticket: Dict[str, Any], texts: List[str]) -> int:
+        """Append custom field values that may contain emails, return chars added"""
+        added = 0
         
-        return emails
+        # Check custom fields and fields object
+        for key in ('custom_fields', 'fields'):
+            for field in ticket.get(key, []):
+                value = field.get('value')
+                if value and type(value) is str and '@' in value:
+                    texts.append(value)
+                    added += len(value)
+        
+        return added
     
-    def _extract_comment_emails(self, ticket: Dict[str, Any]) -> Set[str]:
-        """Extract email addresses from ticket comments"""
-        emails = set()
+    def _collect_comment_texts(self, ticket: Dict[str, Any], texts: List[str]) -> int:
+        """Append comment bodies that may contain emails, return chars added"""
+        added = 0
         
         # Note: Comments might not be included in the basic ticket data
         # They would need to be fetched separately via get_ticket_comments
         comments = ticket.get('comments', [])
         for comment in comments:
             body = comment.get('body', '')
-            if body:
-                found_emails = self.email_pattern.findall(body)
-                for email in found_emails:
-                    if self._validate_email(email):
-                        emails.add(email.lower())
+            # Cheap substring check before queueing long bodies for the regex
+            if body and '@' in body:
+                texts.append(body)
+                added += len(body)
+        
+        return added
+    
+    def _scan_texts(self, columns: tuple, texts: List[str], owners: List[tuple]):
+        """
+        Find emails in all queued texts with a single regex pass
+        
+        The texts are joined with a separator that cannot occur in an email
+        address, and each match is mapped back to the (ticket_id, created_at,
+        source_type) of the text it came from via the text start offsets.
+        
+        Args:
+            columns: Column accumulators from extract_from_tickets
+            texts: Free-text values to scan (cleared on return)
+            owners: Provenance tuple for each entry in texts (cleared on return)
+        """
+        if not texts:
+            return
+        
+        starts = []
+        offset = 0
+        for text in texts:
+            starts.append(offset)
+            offset += len(text) + 1
+        
+        buffer = _TEXT_SEPARATOR.join(texts)
+        for match in self.email_pattern.finditer(buffer):
+            ticket_id, created_at, source_type = owners[bisect_right(starts, match.start()) - 1]
+            self._add_email(columns, intern(match.group(0).lower()), ticket_id, created_at, source_type)
         
-        return emails
+        texts.clear()
+        owners.clear()
     
     def _validate_email(self, email: str) -> bool:
         """Validate email address format"""
         if not email:
             return False
         
-        # Use validators library for validation
-        validation = validators.email(email)
-        return validation is True
+        # Precompiled pattern check (cached per address)
+        return _validate_email_cached(email)
     
     def _add_email(
         self,
-        email_data: Dict[str, Dict[str, Any]],
+        columns: tuple,
         email: str,
-        ticket: Dict[str, Any],
+        ticket_id: Optional[int],
+        created_at: Optional[str],
         source_type: str
     ):
-        """Add email to the email data dictionary"""
-        ticket_id = ticket.get('id')
-        created_at = ticket.get('created_at')
+        """Record an email occurrence in the column accumulators"""
+        ticket_ids, flags, first_seen, last_seen = columns
         
-        data = email_data[email]
+        # Add ticket ID (set membership keeps this O(1) per ticket)
+        ids = ticket_ids.get(email)
+        if ids is None:
+            ids = ticket_ids[email] = set()
+        if ticket_id:
+            ids.add(ticket_id)
         
-        # Add ticket ID if not already present
-        if ticket_id and ticket_id not in data['ticket_ids']:
-            data['ticket_ids'].append(ticket_id)
-            data['ticket_count'] = len(data['ticket_ids'])
-        
-        # Update timestamps
+        # Update timestamps (Zendesk's fixed-width UTC ISO-8601 strings
+        # order chronologically)
         if created_at:
-            if not data['first_seen'] or created_at < data['first_seen']:
-                data['first_seen'] = created_at
-            if not data['last_seen'] or created_at > data['last_seen']:
-                data['last_seen'] = created_at
+            seen = first_seen.get(email)
+            if seen is None or created_at < seen:
+                first_seen[email] = created_at
+            seen = last_seen.get(email)
+            if seen is None or created_at > seen:
+                last_seen[email] = created_at
         
         # Mark source type
-        if source_type == 'requester':
-            data['is_requester'] = True
-        elif source_type == 'cc':
-            data['is_cc'] = True
-        elif source_type == 'comment':
-            data['is_from_comment'] = True
\ No newline at end of file
+        flags[email] = flags.get(email, 0) | _SOURCE_MASKS.get(source_type, 0)
+    
+    def _build_email_data(self, columns: tuple) -> Dict[str, Dict[str, Any]]:
+        """Assemble column accumulators into the per-email metadata dictionary"""
+        ticket_ids, flags, first_seen, last_seen = columns
+        
+        email_data = {}
+        for email, ids in ticket_ids.items():
+            mask = flags[email]
+            email_data[email] = {
+                'ticket_ids': sorted(ids),
+                'ticket_count': len(ids),
+                'first_seen': first_seen.get(email),
+                'last_seen': last_seen.get(email),
+                'is_requester': bool(mask & _SOURCE_REQUESTER),
+                'is_cc': bool(mask & _SOURCE_CC),
+                'is_from_comment': bool(mask & _SOURCE_COMMENT)
+            }
+        
+        return email_data
@@ -16,7 +16,7 @@ from rich.logging import RichHandler
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from config import config
+from config import get_config
 from src.zendesk_client import ZendeskClient, ZendeskAPIError
 from src.ticket_fetcher import TicketFetcher
 from src.email_extractor import EmailExtractor
@@ -82,10 +82,16 @@ def setup_logging(verbose: bool, log_file: Path = None):
 @click.option(
     '--format',
     '-f',
-    type=click.Choice(['csv', 'json', 'txt', 'excel']),
+    type=click.Choice(['csv', 'json', 'txt', 'excel', 'parquet', 'feather']),
     default='csv',
     help='Output format'
 )
+@click.option(
+    '--compression',
+    type=click.Choice(['gzip', 'zstd']),
+    default=None,
+    help='Compress csv, json and txt output'
+)
 @click.option(
     '--output',
     '-o',
@@ -126,6 +132,7 @@ def main(
     include_ccs,
     include_comments,
     format,
+    compression,
     output,
     dry_run,
     use_cache,
@@ -163,6 +170,7 @@ def main(
     log_file = Path("logs") / f"zendesk_export_{datetime.now().strftime('%Y%m%d')}.log"
     setup_logging(verbose, log_file)
     logger = logging.getLogger(__name__)
+    client = None
     
     try:
         # Print banner
@@ -171,6 +179,7 @@ def main(
         
         # Initialize client
         console.print("[cyan]Initializing Zendesk client...[/cyan]")
+        config = get_config()
         client = ZendeskClient(config)
         
         # Test connection
@@ -223,28 +232,28 @@ def main(
                 status=ticket_status,
                 use_cache=use_cache
             )
-            # Flatten all tickets into single list
-            tickets = []
-            for group_tickets in all_tickets_dict.values():
-                tickets.extend(group_tickets)
+            # Keep tickets grouped so groups can be extracted in parallel
+            ticket_groups = list(all_tickets_dict.values())
         else:
-            tickets = fetcher.fetch_tickets_by_group(
+            ticket_groups = [fetcher.fetch_tickets_by_group(
                 group_id=group_id,
                 status=ticket_status,
                 created_after=created_after,
                 use_cache=use_cache
-            )
+            )]
         
-        if not tickets:
+        ticket_count = sum(len(group_tickets) for group_tickets in ticket_groups)
+        
+        if not ticket_count:
             console.print("[yellow]No tickets found with the specified criteria[/yellow]")
             sys.exit(0)
         
-        console.print(f"[green]Found {len(tickets)} tickets[/green]")
+        console.print(f"[green]Found {ticket_count} tickets[/green]")
         
         # Extract emails
         console.print("\n[bold cyan]Extracting email addresses...[/bold cyan]")
-        email_data = extractor.extract_from_tickets(
-            tickets,
+        email_data = extractor.extract_from_ticket_groups(
+            ticket_groups,
             include_ccs=include_ccs,
             include_comments=include_comments
         )
@@ -257,14 +266,15 @@ def main(
         extractor.display_email_summary(email_data)
         
         # Export data
-        output_dir = Path(output) if output else config.output_dir
+        output_dir = Path(output) if output else config.ensure_output_dir()
         formatter = OutputFormatter(output_dir)
         
         console.print(f"\n[cyan]Exporting to {format.upper()} format...[/cyan]")
         output_file = formatter.export_emails(
             email_data,
             format=format,
-            filename_prefix=f"zendesk_emails_{group_id or 'all'}"
+            filename_prefix=f"zendesk_emails_{group_id or 'all'}",
+            compression=compression
         )
         
         # Print final summary
@@ -288,6 +298,10 @@ def main(
         if verbose:
             console.print_exception()
         sys.exit(1)
+    
+    finally:
+        if client is not None:
+            client.close()
 
 
 if __name__ == "__main__":
@@ -2,16 +2,40 @@
 Module for formatting and exporting extracted email data
 """
 
-import json
-import csv
+import gzip
+import heapq
+import importlib.util
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, List, Set, Optional
-import pandas as pd
+from typing import IO, Dict, Any, List, Set, Optional
+import orjson
+import zstandard
 from rich.console import Console
+from .email_extractor import EmailExtractor
 
 console = Console()
 
+# Buffer size for text exports written line by line
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# CSV export layout; lines use CRLF like the csv module's default dialect
+_CSV_HEADER = (
+    "email,ticket_count,is_requester,is_cc,is_from_comment,"
+    "first_seen,last_seen,ticket_ids\r\n"
+)
+_CSV_ROW = "{},{},{},{},{},{},{},{}\r\n"
+
+# Filename suffixes for compressed CSV, JSON and TXT exports
+_COMPRESSION_SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+
+# Prefer xlsxwriter (faster and lighter than openpyxl) for Excel output.
+# Its constant_memory mode is not usable here: pandas writes cells column
+# by column, and that mode drops cells written to already-flushed rows.
+if importlib.util.find_spec('xlsxwriter') is not None:
+    _EXCEL_WRITER_KWARGS = {'engine': 'xlsxwriter'}
+else:
+    _EXCEL_WRITER_KWARGS = {'engine': 'openpyxl'}
+
 
 class OutputFormatter:
     """Class for formatting and exporting email data"""
@@ -24,114 +48,173 @@ class OutputFormatter:
             output_dir: Directory for output files
         """
         self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(exist_ok=True)
+        if not self.output_dir.exists():
+            self.output_dir.mkdir(parents=True, exist_ok=True)
     
     def export_emails(
         self,
         email_data: Dict[str, Dict[str, Any]],
         format: str = "csv",
         filename_prefix: str = "emails",
-        include_stats: bool = True
+        include_stats: bool = True,
+        stats: Optional[Dict[str, Any]] = None,
+        compression: Optional[str] = None
     ) -> Path:
         """
         Export email data to file
         
         Args:
             email_data: Dictionary of email data
-            format: Output format (csv, json, txt)
+            format: Output format (csv, json, txt, excel, parquet, feather)
             filename_prefix: Prefix for output filename
             include_stats: Whether to include statistics
+            stats: Precomputed statistics (computed here if needed and not given)
+            compression: Compress CSV, JSON and TXT output with "gzip" or "zstd"
+                (Excel, Parquet and Feather files are already compressed)
             
         Returns:
             Path to exported file
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Read the clock once so the filename and file headers agree
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        
+        if compression is not None and compression not in _COMPRESSION_SUFFIXES:
+            raise ValueError(f"Unsupported compression: {compression}")
+        if compression is not None and format not in ("csv", "json", "txt"):
+            console.print(f"[yellow]⚠ {format} output is already compressed; ignoring {compression}[/yellow]")
+            compression = None
+        
+        # Only JSON and Excel embed statistics; compute them at most once
+        if not include_stats or format not in ("json", "excel"):
+            stats = None
+        elif stats is None:
+            stats = EmailExtractor().get_email_statistics(email_data)
         
         if format == "csv":
-            filepath = self._export_to_csv(email_data, f"{filename_prefix}_{timestamp}")
+            filepath = self._export_to_csv(email_data, f"{filename_prefix}_{timestamp}", compression)
         elif format == "json":
-            filepath = self._export_to_json(email_data, f"{filename_prefix}_{timestamp}", include_stats)
+            filepath = self._export_to_json(
+                email_data, f"{filename_prefix}_{timestamp}", stats, now, compression
+            )
         elif format == "txt":
-            filepath = self._export_to_txt(email_data, f"{filename_prefix}_{timestamp}")
+            filepath = self._export_to_txt(email_data, f"{filename_prefix}_{timestamp}", now, compression)
         elif format == "excel":
-            filepath = self._export_to_excel(email_data, f"{filename_prefix}_{timestamp}", include_stats)
+            filepath = self._export_to_excel(email_data, f"{filename_prefix}_{timestamp}", stats)
+        elif format in ("parquet", "feather"):
+            filepath = self._export_to_columnar(email_data, f"{filename_prefix}_{timestamp}", format)
         else:
             raise ValueError(f"Unsupported format: {format}")
         
         console.print(f"[green]✓[/green] Exported to: [cyan]{filepath}[/cyan]")
         return filepath
     
-    def _export_to_csv(self, email_data: Dict[str, Dict[str, Any]], filename: str) -> Path:
-        """Export email data to CSV file"""
-        filepath = self.output_dir / f"{filename}.csv"
-        
-        with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = [
-                'email', 
-                'ticket_count', 
-                'is_requester', 
-                'is_cc',
-                'is_from_comment',
-                'first_seen', 
-                'last_seen',
-                'ticket_ids'
-            ]
-            
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
+    def _open_output(self, filepath: Path, mode: str, compression: Optional[str], **kwargs) -> IO:
+        """
+        Open an export file for writing, optionally compressed
+        
+        Args:
+            filepath: Path to write, including any compression suffix
+            mode: 'wt' for text or 'wb' for bytes
+            compression: None, "gzip" or "zstd"
+            **kwargs: Text options (encoding, newline) for text mode
             
-            for email, data in sorted(email_data.items()):
-                row = {
-                    'email': email,
-                    'ticket_count': data['ticket_count'],
-                    'is_requester': 'Yes' if data['is_requester'] else 'No',
-                    'is_cc': 'Yes' if data['is_cc'] else 'No',
-                    'is_from_comment': 'Yes' if data['is_from_comment'] else 'No',
-                    'first_seen': data['first_seen'] or '',
-                    'last_seen': data['last_seen'] or '',
-                    'ticket_ids': ','.join(str(tid) for tid in data['ticket_ids'][:10])  # First 10 IDs
-                }
-                writer.writerow(row)
+        Returns:
+            Writable file object
+        """
+        if compression == "gzip":
+            # Level 1 is the fastest and still several times smaller
+            return gzip.open(filepath, mode, compresslevel=1, **kwargs)
+        if compression == "zstd":
+            return zstandard.open(filepath, mode, cctx=zstandard.ZstdCompressor(level=3), **kwargs)
+        return open(filepath, mode, buffering=_WRITE_BUFFER_SIZE, **kwargs)
+    
+    def _export_to_csv(
+        self,
+        email_data: Dict[str, Dict[str, Any]],
+        filename: str,
+        compression: Optional[str] = None
+    ) -> Path:
+        """Export email data to CSV file"""
+        filepath = self.output_dir / f"{filename}.csv{_COMPRESSION_SUFFIXES.get(compression, '')}"
+        
+        with self._open_output(filepath, 'wt', compression, newline='', encoding='utf-8') as csvfile:
+            csvfile.write(_CSV_HEADER)
+            csvfile.writelines(
+                self._format_csv_row(email, email_data[email])
+                for email in sorted(email_data)
+            )
         
         return filepath
     
+    def _format_csv_row(self, email: str, data: Dict[str, Any]) -> str:
+        """Format one email as a CSV line"""
+        # Extracted emails, ISO timestamps and Yes/No flags never need CSV
+        # quoting; only the joined ticket ID list can contain the delimiter
+        ticket_ids = ','.join(map(str, data['ticket_ids'][:10]))  # First 10 IDs
+        if ',' in ticket_ids:
+            ticket_ids = f'"{ticket_ids}"'
+        
+        return _CSV_ROW.format(
+            email,
+            data['ticket_count'],
+            'Yes' if data['is_requester'] else 'No',
+            'Yes' if data['is_cc'] else 'No',
+            'Yes' if data['is_from_comment'] else 'No',
+            data['first_seen'] or '',
+            data['last_seen'] or '',
+            ticket_ids
+        )
+    
     def _export_to_json(
         self, 
         email_data: Dict[str, Dict[str, Any]], 
         filename: str,
-        include_stats: bool
+        stats: Optional[Dict[str, Any]],
+        export_date: datetime,
+        compression: Optional[str] = None
     ) -> Path:
         """Export email data to JSON file"""
-        filepath = self.output_dir / f"{filename}.json"
+        filepath = self.output_dir / f"{filename}.json{_COMPRESSION_SUFFIXES.get(compression, '')}"
         
-        output = {
-            'export_date': datetime.now().isoformat(),
-            'total_emails': len(email_data),
-            'emails': email_data
-        }
-        
-        if include_stats:
-            from .email_extractor import EmailExtractor
-            extractor = EmailExtractor()
-            output['statistics'] = extractor.get_email_statistics(email_data)
-        
-        with open(filepath, 'w', encoding='utf-8') as jsonfile:
-            json.dump(output, jsonfile, indent=2, default=str)
+        # Stream one record at a time so the whole document is never
+        # materialized in memory
+        with self._open_output(filepath, 'wb', compression) as jsonfile:
+            jsonfile.write(b'{\n  "export_date": ' + orjson.dumps(export_date.isoformat()))
+            jsonfile.write(b',\n  "total_emails": %d' % len(email_data))
+            jsonfile.write(b',\n  "emails": {')
+            
+            separator = b'\n    '
+            for email, data in email_data.items():
+                jsonfile.write(separator + orjson.dumps(email) + b': ' + orjson.dumps(data, default=str))
+                separator = b',\n    '
+            jsonfile.write(b'\n  }' if email_data else b'}')
+            
+            if stats is not None:
+                jsonfile.write(b',\n  "statistics": ' + orjson.dumps(stats, default=str))
+            
+            jsonfile.write(b'\n}\n')
         
         return filepath
     
-    def _export_to_txt(self, email_data: Dict[str, Dict[str, Any]], filename: str) -> Path:
+    def _export_to_txt(
+        self,
+        email_data: Dict[str, Dict[str, Any]],
+        filename: str,
+        export_date: datetime,
+        compression: Optional[str] = None
+    ) -> Path:
         """Export email list to plain text file"""
-        filepath = self.output_dir / f"{filename}.txt"
+        filepath = self.output_dir / f"{filename}.txt{_COMPRESSION_SUFFIXES.get(compression, '')}"
         
-        with open(filepath, 'w', encoding='utf-8') as txtfile:
+        with self._open_output(filepath, 'wt', compression, encoding='utf-8') as txtfile:
             # Write header
-            txtfile.write(f"# Email Export - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            txtfile.write(f"# Email Export - {export_date.isoformat(sep=' ', timespec='seconds')}\n")
             txtfile.write(f"# Total unique emails: {len(email_data)}\n")
             txtfile.write("#" + "=" * 50 + "\n\n")
             
             # Write emails (one per line)
-            for email in sorted(email_data.keys()):
+            for email in sorted(email_data):
                 txtfile.write(f"{email}\n")
         
         return filepath
@@ -140,38 +223,36 @@ class OutputFormatter:
         self,
         email_data: Dict[str, Dict[str, Any]],
         filename: str,
-        include_stats: bool
+        stats: Optional[Dict[str, Any]]
     ) -> Path:
         """Export email data to Excel file with multiple sheets"""
+        # pandas is slow to import, so load it only for the formats using it
+        import pandas as pd
+        
         filepath = self.output_dir / f"{filename}.xlsx"
         
-        # Prepare main data
-        records = []
-        for email, data in email_data.items():
-            records.append({
-                'Email': email,
-                'Ticket Count': data['ticket_count'],
-                'Type': self._get_email_type(data),
-                'First Seen': data['first_seen'],
-                'Last Seen': data['last_seen'],
-                'Is Requester': data['is_requester'],
-                'Is CC': data['is_cc'],
-                'From Comment': data['is_from_comment']
-            })
+        # Prepare main data as columns so pandas gets one typed array each
+        records = list(email_data.values())
+        email_columns = {
+            'Email': list(email_data),
+            'Ticket Count': [data['ticket_count'] for data in records],
+            'Type': [self._get_email_type(data) for data in records],
+            'First Seen': [data['first_seen'] for data in records],
+            'Last Seen': [data['last_seen'] for data in records],
+            'Is Requester': [data['is_requester'] for data in records],
+            'Is CC': [data['is_cc'] for data in records],
+            'From Comment': [data['is_from_comment'] for data in records]
+        }
         
         # Create Excel writer
-        with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
+        with pd.ExcelWriter(filepath, **_EXCEL_WRITER_KWARGS) as writer:
             # Main email data sheet
-            df_emails = pd.DataFrame(records)
-            df_emails = df_emails.sort_values('Ticket Count', ascending=False)
+            df_emails = pd.DataFrame(email_columns)
+            df_emails.sort_values('Ticket Count', ascending=False, inplace=True)
             df_emails.to_excel(writer, sheet_name='Emails', index=False)
             
             # Statistics sheet
-            if include_stats:
-                from .email_extractor import EmailExtractor
-                extractor = EmailExtractor()
-                stats = extractor.get_email_statistics(email_data)
-                
+            if stats is not None:
                 stats_data = [
                     {'Metric': 'Total Unique Emails', 'Value': stats['total_unique_emails']},
                     {'Metric': 'Total Tickets', 'Value': stats['total_tickets']},
@@ -185,14 +266,14 @@ class OutputFormatter:
                 df_stats.to_excel(writer, sheet_name='Statistics', index=False)
             
             # Top requesters sheet
-            requester_emails = [
-                (email, data) for email, data in email_data.items() 
-                if data['is_requester']
-            ]
-            requester_emails.sort(key=lambda x: x[1]['ticket_count'], reverse=True)
+            requester_emails = heapq.nlargest(
+                50,  # Top 50
+                ((email, data) for email, data in email_data.items() if data['is_requester']),
+                key=lambda x: x[1]['ticket_count']
+            )
             
             top_requesters = []
-            for email, data in requester_emails[:50]:  # Top 50
+            for email, data in requester_emails:
                 top_requesters.append({
                     'Email': email,
                     'Ticket Count': data['ticket_count'],
@@ -206,6 +287,37 @@ class OutputFormatter:
         
         return filepath
     
+    def _export_to_columnar(
+        self,
+        email_data: Dict[str, Dict[str, Any]],
+        filename: str,
+        format: str
+    ) -> Path:
+        """Export email data to a zstd-compressed Parquet or Feather file"""
+        import pandas as pd
+        
+        filepath = self.output_dir / f"{filename}.{format}"
+        
+        emails = sorted(email_data)
+        records = [email_data[email] for email in emails]
+        df = pd.DataFrame({
+            'email': emails,
+            'ticket_count': [data['ticket_count'] for data in records],
+            'is_requester': [data['is_requester'] for data in records],
+            'is_cc': [data['is_cc'] for data in records],
+            'is_from_comment': [data['is_from_comment'] for data in records],
+            'first_seen': [data['first_seen'] for data in records],
+            'last_seen': [data['last_seen'] for data in records],
+            'ticket_ids': [data['ticket_ids'] for data in records]
+        })
+        
+        if format == "parquet":
+            df.to_parquet(filepath, engine='pyarrow', compression='zstd', index=False)
+        else:
+            df.to_feather(filepath, compression='zstd')
+        
+        return filepath
+    
     def _get_email_type(self, data: Dict[str, Any]) -> str:
         """Get email type string"""
         types = []
@@ -226,24 +338,26 @@ class OutputFormatter:
         console.print("\n[bold cyan]Email Export Summary[/bold cyan]")
         console.print("=" * 50)
         
-        # Basic stats
+        # Basic stats (single pass)
         total_emails = len(email_data)
-        requester_count = sum(1 for d in email_data.values() if d['is_requester'])
-        cc_count = sum(1 for d in email_data.values() if d['is_cc'])
+        requester_count = cc_count = 0
+        for d in email_data.values():
+            requester_count += d['is_requester']
+            cc_count += d['is_cc']
         
         console.print(f"Total unique emails: [green]{total_emails}[/green]")
         console.print(f"Requester emails: [yellow]{requester_count}[/yellow]")
         console.print(f"CC emails: [yellow]{cc_count}[/yellow]")
         
         # Top 5 emails by ticket count
-        sorted_emails = sorted(
+        top_emails = heapq.nlargest(
+            5,
             email_data.items(),
-            key=lambda x: x[1]['ticket_count'],
-            reverse=True
+            key=lambda x: x[1]['ticket_count']
         )
         
         console.print("\n[bold]Top 5 emails by ticket count:[/bold]")
-        for email, data in sorted_emails[:5]:
+        for email, data in top_emails:
             console.print(f"  • {email}: {data['ticket_count']} tickets")
         
         console.print("=" * 50)
\ No newline at end of file
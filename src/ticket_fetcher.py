@@ -2,12 +2,15 @@
 Module for fetching tickets from Zendesk groups
 """
 
+import hashlib
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 from rich.console import Console
-from rich.table import Table
-import json
+import msgpack
+import zstandard
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -28,7 +31,8 @@ class TicketFetcher:
         self.client = client
         self.config = config
         self.cache_dir = Path(".cache")
-        self.cache_dir.mkdir(exist_ok=True)
+        if not self.cache_dir.exists():
+            self.cache_dir.mkdir(exist_ok=True)
     
     def fetch_tickets_by_group(
         self, 
@@ -126,17 +130,31 @@ class TicketFetcher:
         # Display groups
         self._display_groups(groups)
         
-        # Fetch tickets for each group
+        # Fetch tickets for each group concurrently; requests are network-bound
+        # and the client enforces the account-wide rate limit across threads
+        group_tickets = {}
+        with ThreadPoolExecutor(max_workers=min(8, len(groups))) as executor:
+            futures = {}
+            for group in groups:
+                group_id = str(group['id'])
+                group_name = group.get('name', 'Unknown')
+                
+                console.print(f"\n[cyan]Fetching tickets for group: {group_name} (ID: {group_id})[/cyan]")
+                
+                future = executor.submit(
+                    self.fetch_tickets_by_group, group_id, status=status, use_cache=use_cache
+                )
+                futures[future] = group_id
+            
+            for future in as_completed(futures):
+                group_tickets[futures[future]] = future.result()
+        
+        # Keep the original group order in the result
         all_tickets = {}
         for group in groups:
             group_id = str(group['id'])
-            group_name = group.get('name', 'Unknown')
-            
-            console.print(f"\n[cyan]Fetching tickets for group: {group_name} (ID: {group_id})[/cyan]")
-            
-            tickets = self.fetch_tickets_by_group(group_id, status=status, use_cache=use_cache)
-            if tickets:
-                all_tickets[group_id] = tickets
+            if group_tickets.get(group_id):
+                all_tickets[group_id] = group_tickets[group_id]
         
         return all_tickets
     
@@ -256,6 +274,8 @@ class TicketFetcher:
     
     def _display_groups(self, groups: List[Dict[str, Any]]):
         """Display groups in a table"""
+        from rich.table import Table
+        
         table = Table(title="Available Groups")
         table.add_column("ID", style="cyan")
         table.add_column("Name", style="green")
@@ -263,13 +283,11 @@ class TicketFetcher:
         
         for group in groups:
             created_at = group.get('created_at', 'Unknown')
-            if created_at != 'Unknown':
-                # Parse and format the date
-                try:
-                    dt = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                    created_at = dt.strftime("%Y-%m-%d")
-                except:
-                    pass
+            if isinstance(created_at, str):
+                # ISO 8601 timestamps start with the YYYY-MM-DD date
+                created_at = created_at[:10]
+            else:
+                created_at = 'Unknown'
             
             table.add_row(
                 str(group['id']),
@@ -286,27 +304,25 @@ class TicketFetcher:
         created_after: Optional[datetime],
         created_before: Optional[datetime]
     ) -> str:
-        """Generate cache key for ticket search"""
-        parts = [f"group_{group_id}"]
-        
-        if status:
-            parts.append(f"status_{status}")
-        
-        if created_after:
-            parts.append(f"after_{created_after.strftime('%Y%m%d')}")
-        
-        if created_before:
-            parts.append(f"before_{created_before.strftime('%Y%m%d')}")
-        
-        return "_".join(parts) + ".json"
+        """Generate cache key (hashed filename) for ticket search"""
+        # Dates are keyed by day so repeated runs on the same day hit the cache
+        search = (
+            str(group_id),
+            status,
+            created_after.date() if created_after else None,
+            created_before.date() if created_before else None
+        )
+        digest = hashlib.blake2b(repr(search).encode(), digest_size=8).hexdigest()
+        logger.debug(f"Cache key {digest} for search {search}")
+        return f"{digest}.msgpack.zst"
     
     def _save_to_cache(self, cache_key: str, data: List[Dict[str, Any]]):
         """Save data to cache file"""
         cache_file = self.cache_dir / cache_key
         
         try:
-            with open(cache_file, 'w') as f:
-                json.dump(data, f)
+            packed = msgpack.packb(data)
+            cache_file.write_bytes(zstandard.ZstdCompressor(level=3).compress(packed))
             logger.debug(f"Saved {len(data)} items to cache: {cache_key}")
         except Exception as e:
             logger.error(f"Failed to save cache: {e}")
@@ -315,18 +331,19 @@ class TicketFetcher:
         """Load data from cache file"""
         cache_file = self.cache_dir / cache_key
         
-        if not cache_file.exists():
+        try:
+            modified = cache_file.stat().st_mtime
+        except FileNotFoundError:
             return None
         
         # Check if cache is fresh (less than 1 hour old)
-        cache_age = datetime.now() - datetime.fromtimestamp(cache_file.stat().st_mtime)
-        if cache_age > timedelta(hours=1):
+        if time.time() - modified > 3600:
             logger.debug(f"Cache expired: {cache_key}")
             return None
         
         try:
-            with open(cache_file, 'r') as f:
-                data = json.load(f)
+            packed = zstandard.ZstdDecompressor().decompress(cache_file.read_bytes())
+            data = msgpack.unpackb(packed, raw=False)
             logger.debug(f"Loaded {len(data)} items from cache: {cache_key}")
             return data
         except Exception as e:
@@ -335,7 +352,8 @@ class TicketFetcher:
     
     def clear_cache(self):
         """Clear all cached data"""
-        cache_files = list(self.cache_dir.glob("*.json"))
+        # Also remove JSON files left by the previous cache format
+        cache_files = list(self.cache_dir.glob("*.msgpack.zst")) + list(self.cache_dir.glob("*.json"))
         for file in cache_files:
             file.unlink()
         
@@ -2,12 +2,14 @@
 Zendesk API client for making authenticated requests
 """
 
+import asyncio
 import logging
+import threading
 import time
+from collections import deque
 from typing import Dict, Any, Optional, List
-import requests
-from requests.adapters import HTTPAdapter
-from requests.packages.urllib3.util.retry import Retry
+import httpx
+import orjson
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
@@ -15,6 +17,13 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 console = Console()
 logger = logging.getLogger(__name__)
 
+# Transient HTTP statuses that are retried; 429 waits for its Retry-After
+# header, the others back off exponentially
+_RETRY_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+
+# Pages requested concurrently by get_paginated_async
+_PREFETCH_PAGES = 4
+
 
 class ZendeskAPIError(Exception):
     """Custom exception for Zendesk API errors"""
@@ -38,65 +47,123 @@ class ZendeskClient:
         """
         self.config = config
         self.session = self._create_session()
-        self.request_count = 0
-        self.last_request_time = time.time()
-        
-    def _create_session(self) -> requests.Session:
-        """Create a requests session with retry logic"""
-        session = requests.Session()
-        
-        # Set up retry strategy
-        retry_strategy = Retry(
-            total=self.config.max_retries,
-            backoff_factor=1,
-            status_forcelist=[408, 429, 500, 502, 503, 504],
-            allowed_methods=["GET", "POST", "PUT", "DELETE"]
-        )
+        # Send times (time.monotonic) of the most recent requests, one per
+        # allowed request in the rate-limit window
+        self._request_times = deque(maxlen=self.config.rate_limit_requests)
+        # Guards rate-limit state when the client is shared between threads
+        self._rate_limit_lock = threading.Lock()
+        # Async clients keyed by event loop, so each loop reuses its pooled
+        # connection; _run_async keeps one long-lived loop per thread
+        self._async_sessions: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+        self._async_lock = threading.Lock()
+        self._thread_state = threading.local()
         
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
+    def _create_session(self) -> httpx.Client:
+        """Create a pooled HTTP/2 client with connection retry logic"""
+        # All requests to the subdomain are multiplexed over one pooled
+        # HTTP/2 connection; the transport retries failed connects
+        transport = httpx.HTTPTransport(http2=True, retries=self.config.max_retries)
         
-        # Set authentication and headers
-        session.auth = self.config.auth
-        session.headers.update(self.config.headers)
+        return httpx.Client(
+            auth=self.config.auth,
+            headers=self.config.headers,
+            timeout=self.config.timeout,
+            transport=transport
+        )
+    
+    def _create_async_session(self) -> httpx.AsyncClient:
+        """Create an async HTTP/2 client with the same settings as the session"""
+        transport = httpx.AsyncHTTPTransport(http2=True, retries=self.config.max_retries)
         
+        return httpx.AsyncClient(
+            auth=self.config.auth,
+            headers=self.config.headers,
+            timeout=self.config.timeout,
+            transport=transport
+        )
+    
+    def _get_async_session(self) -> httpx.AsyncClient:
+        """Get the async client for the running event loop, creating it once"""
+        loop = asyncio.get_running_loop()
+        with self._async_lock:
+            session = self._async_sessions.get(loop)
+            if session is None:
+                session = self._async_sessions[loop] = self._create_async_session()
         return session
     
+    def _run_async(self, coro):
+        """
+        Run a coroutine to completion on this thread's event loop
+        
+        Unlike asyncio.run, the loop outlives the call, so the async client
+        bound to it keeps its connection open between calls.
+        
+        Args:
+            coro: Coroutine to run
+            
+        Returns:
+            The coroutine's result
+        """
+        loop = getattr(self._thread_state, 'loop', None)
+        if loop is None:
+            loop = self._thread_state.loop = asyncio.new_event_loop()
+        return loop.run_until_complete(coro)
+    
+    def close(self):
+        """Close the HTTP session and every async client and event loop"""
+        self.session.close()
+        with self._async_lock:
+            sessions, self._async_sessions = self._async_sessions, {}
+        for loop, session in sessions.items():
+            if not loop.is_closed():
+                loop.run_until_complete(session.aclose())
+                loop.close()
+    
+    def _reserve_request_slot(self) -> float:
+        """
+        Reserve a send time for the next request under the rate limit
+        
+        Uses a sliding window: a request may be sent once the request
+        rate_limit_requests places earlier is at least rate_limit_window
+        seconds old.
+        
+        Returns:
+            Seconds to wait before sending the request
+        """
+        with self._rate_limit_lock:
+            now = time.monotonic()
+            send_at = now
+            if len(self._request_times) == self._request_times.maxlen:
+                send_at = max(now, self._request_times[0] + self.config.rate_limit_window)
+            self._request_times.append(send_at)
+        
+        return send_at - now
+    
     def _check_rate_limit(self):
         """Check and enforce rate limiting"""
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
-        
-        if time_since_last_request < self.config.rate_limit_window:
-            if self.request_count >= self.config.rate_limit_requests:
-                sleep_time = self.config.rate_limit_window - time_since_last_request
-                logger.warning(f"Rate limit reached. Sleeping for {sleep_time:.2f} seconds")
-                time.sleep(sleep_time)
-                self.request_count = 0
-                self.last_request_time = time.time()
-        else:
-            self.request_count = 0
-            self.last_request_time = current_time
+        wait_time = self._reserve_request_slot()
+        if wait_time > 0:
+            logger.warning(f"Rate limit reached. Sleeping for {wait_time:.2f} seconds")
+            time.sleep(wait_time)
     
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type(requests.RequestException)
+        retry=retry_if_exception_type(httpx.TransportError)
     )
     def _make_request(
         self, 
         method: str, 
         url: str, 
         **kwargs
-    ) -> requests.Response:
+    ) -> httpx.Response:
         """
         Make an HTTP request to Zendesk API
         
         Args:
             method: HTTP method (GET, POST, etc.)
             url: URL to request
-            **kwargs: Additional arguments to pass to requests
+            **kwargs: Additional arguments to pass to httpx
             
         Returns:
             Response object
@@ -105,48 +172,121 @@ class ZendeskClient:
             ZendeskAPIError: If API returns an error
             RateLimitExceeded: If rate limit is exceeded
         """
-        self._check_rate_limit()
-        
         # Set timeout if not provided
         kwargs.setdefault('timeout', self.config.timeout)
         
         try:
-            response = self.session.request(method, url, **kwargs)
-            self.request_count += 1
+            for attempt in range(self.config.max_retries + 1):
+                self._check_rate_limit()
+                response = self.session.request(method, url, **kwargs)
+                
+                if response.status_code not in _RETRY_STATUSES or attempt == self.config.max_retries:
+                    break
+                
+                delay = self._retry_delay(response, attempt)
+                logger.warning(
+                    f"Received HTTP {response.status_code}. Retrying in {delay} seconds"
+                )
+                time.sleep(delay)
             
-            # Check for rate limiting
+            # Check for rate limiting that outlasted the retries
             if response.status_code == 429:
-                retry_after = int(response.headers.get('Retry-After', 60))
-                logger.warning(f"Rate limit exceeded. Retry after {retry_after} seconds")
-                time.sleep(retry_after)
-                raise RateLimitExceeded(f"Rate limit exceeded. Retry after {retry_after} seconds")
+                self._raise_rate_limit_exceeded(response)
             
             # Check for other errors
             response.raise_for_status()
             
             return response
             
-        except requests.exceptions.HTTPError as e:
-            error_msg = f"HTTP error occurred: {e}"
-            if response.text:
-                error_msg += f" Response: {response.text}"
-            logger.error(error_msg)
-            raise ZendeskAPIError(error_msg) from e
+        except httpx.HTTPError as e:
+            raise self._api_error(e) from e
+    
+    async def _make_request_async(
+        self,
+        session: httpx.AsyncClient,
+        method: str,
+        url: str,
+        **kwargs
+    ) -> httpx.Response:
+        """
+        Make an HTTP request to Zendesk API from an async session
+        
+        Applies the same rate limiting, retries and error handling as
+        _make_request without blocking the event loop.
+        
+        Args:
+            session: AsyncClient from _get_async_session
+            method: HTTP method (GET, POST, etc.)
+            url: URL to request
+            **kwargs: Additional arguments to pass to httpx
+            
+        Returns:
+            Response object
+            
+        Raises:
+            ZendeskAPIError: If API returns an error
+            RateLimitExceeded: If rate limit is exceeded
+        """
+        try:
+            for attempt in range(self.config.max_retries + 1):
+                wait_time = self._reserve_request_slot()
+                if wait_time > 0:
+                    logger.warning(f"Rate limit reached. Sleeping for {wait_time:.2f} seconds")
+                    await asyncio.sleep(wait_time)
+                response = await session.request(method, url, **kwargs)
+                
+                if response.status_code not in _RETRY_STATUSES or attempt == self.config.max_retries:
+                    break
+                
+                delay = self._retry_delay(response, attempt)
+                logger.warning(
+                    f"Received HTTP {response.status_code}. Retrying in {delay} seconds"
+                )
+                await asyncio.sleep(delay)
+            
+            # Check for rate limiting that outlasted the retries
+            if response.status_code == 429:
+                self._raise_rate_limit_exceeded(response)
             
-        except requests.exceptions.ConnectionError as e:
-            error_msg = f"Connection error occurred: {e}"
-            logger.error(error_msg)
-            raise ZendeskAPIError(error_msg) from e
+            # Check for other errors
+            response.raise_for_status()
             
-        except requests.exceptions.Timeout as e:
-            error_msg = f"Request timeout: {e}"
-            logger.error(error_msg)
-            raise ZendeskAPIError(error_msg) from e
+            return response
             
-        except requests.exceptions.RequestException as e:
-            error_msg = f"Request error: {e}"
-            logger.error(error_msg)
-            raise ZendeskAPIError(error_msg) from e
+        except httpx.HTTPError as e:
+            raise self._api_error(e) from e
+    
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> float:
+        """Seconds to wait before retrying a request that got a retryable status"""
+        if response.status_code == 429:
+            return int(response.headers.get('Retry-After', 60))
+        return self.config.retry_delay * 2 ** attempt
+    
+    def _raise_rate_limit_exceeded(self, response: httpx.Response):
+        """Raise RateLimitExceeded for a 429 response after retries ran out"""
+        retry_after = int(response.headers.get('Retry-After', 60))
+        error_msg = (
+            f"Rate limit exceeded after {self.config.max_retries} retries. "
+            f"Retry after {retry_after} seconds"
+        )
+        logger.warning(error_msg)
+        raise RateLimitExceeded(error_msg)
+    
+    def _api_error(self, error: httpx.HTTPError) -> ZendeskAPIError:
+        """Log an httpx error and wrap it in a ZendeskAPIError"""
+        if isinstance(error, httpx.HTTPStatusError):
+            error_msg = f"HTTP error occurred: {error}"
+            if error.response.text:
+                error_msg += f" Response: {error.response.text}"
+        elif isinstance(error, httpx.ConnectError):
+            error_msg = f"Connection error occurred: {error}"
+        elif isinstance(error, httpx.TimeoutException):
+            error_msg = f"Request timeout: {error}"
+        else:
+            error_msg = f"Request error: {error}"
+        
+        logger.error(error_msg)
+        return ZendeskAPIError(error_msg)
     
     def get(self, url: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -160,7 +300,9 @@ class ZendeskClient:
             JSON response as dictionary
         """
         response = self._make_request('GET', url, params=params)
-        return response.json()
+        # Responses are not streamed, so content is the fully buffered body;
+        # orjson decodes the bytes directly without a str round trip
+        return orjson.loads(response.content)
     
     def post(self, url: str, json_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -174,74 +316,199 @@ class ZendeskClient:
             JSON response as dictionary
         """
         response = self._make_request('POST', url, json=json_data)
-        return response.json()
+        return orjson.loads(response.content)
     
     def get_paginated(
         self, 
         url: str, 
         params: Optional[Dict[str, Any]] = None,
-        max_pages: Optional[int] = None
+        max_pages: Optional[int] = None,
+        cursor: bool = False
     ) -> List[Dict[str, Any]]:
         """
         Get all pages of results from a paginated endpoint
         
+        Only the first request is built from url and params; later pages are
+        fetched from the next-page URL returned by Zendesk, which already
+        encodes the query and the page cursor or number.
+        
         Args:
             url: URL to request
             params: Query parameters
             max_pages: Maximum number of pages to fetch (None for all)
+            cursor: Use cursor pagination (list endpoints) instead of
+                offset pagination (required for the Search API)
             
         Returns:
             List of all results across all pages
         """
-        if params is None:
-            params = {}
+        params = dict(params) if params else {}
         
-        params['per_page'] = self.config.page_size
+        if cursor:
+            params['page[size]'] = self.config.page_size
+        else:
+            params['per_page'] = self.config.page_size
         all_results = []
-        page = 1
+        page = 0
+        next_url = url
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-            transient=True
-        ) as progress:
+        with self._progress() as progress:
             task = progress.add_task("[cyan]Fetching data from Zendesk...", total=None)
             
-            while True:
-                if max_pages and page > max_pages:
+            while next_url:
+                if max_pages and page >= max_pages:
                     break
                 
-                params['page'] = page
-                response = self.get(url, params)
-                
-                # Handle different response formats
-                if 'results' in response:
-                    results = response['results']
-                elif 'tickets' in response:
-                    results = response['tickets']
-                elif 'users' in response:
-                    results = response['users']
-                elif 'groups' in response:
-                    results = response['groups']
-                else:
-                    results = response
+                response = self.get(next_url, params if page == 0 else None)
+                page += 1
                 
+                results = self._extract_results(response)
                 if not results:
                     break
                 
                 all_results.extend(results)
                 progress.update(task, description=f"[cyan]Fetched {len(all_results)} items...")
                 
-                # Check for next page
-                if 'next_page' in response and response['next_page']:
-                    page += 1
+                # Follow the next page link: cursor endpoints report
+                # meta.has_more and links.next, offset endpoints next_page
+                if response.get('meta', {}).get('has_more'):
+                    next_url = response['links']['next']
                 else:
-                    break
+                    next_url = response.get('next_page')
         
         logger.info(f"Fetched {len(all_results)} total items across {page} pages")
         return all_results
     
+    async def get_paginated_async(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        max_pages: Optional[int] = None,
+        prefetch: int = _PREFETCH_PAGES
+    ) -> List[Dict[str, Any]]:
+        """
+        Get all pages of an offset-paginated endpoint, several pages at a time
+        
+        Page N+1 is normally only discovered from page N's response. Here,
+        page 1 is fetched alone and its result count tells how many pages
+        remain; those are then requested up to `prefetch` at a time. When
+        the response has no count, pages are requested speculatively and
+        results past the first short or final page are discarded.
+        Cursor-paginated endpoints must use get_paginated.
+        
+        Args:
+            url: URL to request
+            params: Query parameters
+            max_pages: Maximum number of pages to fetch (None for all)
+            prefetch: Number of pages to keep in flight
+            
+        Returns:
+            List of all results across all pages
+        """
+        params = dict(params) if params else {}
+        params['per_page'] = self.config.page_size
+        all_results = []
+        page = 1
+        pages_used = 0
+        last_page = max_pages
+        finished = False
+        
+        with self._progress() as progress:
+            task = progress.add_task("[cyan]Fetching data from Zendesk...", total=None)
+            
+            session = self._get_async_session()
+            while not finished and not (last_page and page > last_page):
+                window_end = page if page == 1 else page + prefetch - 1
+                if last_page:
+                    window_end = min(window_end, last_page)
+                
+                pages = await self._gather_pages_async(session, url, params, range(page, window_end + 1))
+                
+                for data in pages:
+                    pages_used += 1
+                    results = self._extract_results(data)
+                    if results:
+                        all_results.extend(results)
+                    if len(results) < self.config.page_size or not data.get('next_page'):
+                        finished = True
+                        break
+                
+                # Bound the remaining pages by the total reported on page 1
+                total = data.get('count') if page == 1 else None
+                if type(total) is int:
+                    total_pages = -(-total // self.config.page_size)
+                    last_page = min(last_page, total_pages) if last_page else total_pages
+                
+                page = window_end + 1
+                progress.update(task, description=f"[cyan]Fetched {len(all_results)} items...")
+        
+        logger.info(f"Fetched {len(all_results)} total items across {pages_used} pages")
+        return all_results
+    
+    async def _gather_pages_async(
+        self,
+        session: httpx.AsyncClient,
+        url: str,
+        params: Dict[str, Any],
+        page_numbers: range
+    ) -> List[Dict[str, Any]]:
+        """
+        Request several pages concurrently and decode them in page order
+        
+        If any request fails, the others are cancelled and awaited before
+        the error propagates, so none are left pending on the event loop
+        (which outlives this call, see _run_async).
+        
+        Args:
+            session: AsyncClient from _get_async_session
+            url: URL to request
+            params: Query parameters shared by all pages
+            page_numbers: Page numbers to request
+            
+        Returns:
+            Decoded JSON response for each page
+        """
+        tasks = [
+            asyncio.ensure_future(
+                self._make_request_async(session, 'GET', url, params={**params, 'page': number})
+            )
+            for number in page_numbers
+        ]
+        try:
+            responses = await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        
+        return [orjson.loads(response.content) for response in responses]
+    
+    def _progress(self) -> Progress:
+        """Create a transient spinner for pagination progress"""
+        # rich allows only one live display at a time, so only show progress
+        # when paginating from the main thread
+        return Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console,
+            transient=True,
+            disable=threading.current_thread() is not threading.main_thread()
+        )
+    
+    @staticmethod
+    def _extract_results(response: Any) -> List[Dict[str, Any]]:
+        """Get the list of items from a paginated response"""
+        # Handle different response formats
+        if 'results' in response:
+            return response['results']
+        elif 'tickets' in response:
+            return response['tickets']
+        elif 'users' in response:
+            return response['users']
+        elif 'groups' in response:
+            return response['groups']
+        return response
+    
     def test_connection(self) -> bool:
         """
         Test connection to Zendesk API
@@ -278,7 +545,7 @@ class ZendeskClient:
             List of group dictionaries
         """
         url = self.config.get_endpoint('groups')
-        return self.get_paginated(url)
+        return self.get_paginated(url, cursor=True)
     
     def search_tickets(
         self, 
@@ -309,13 +576,14 @@ class ZendeskClient:
         # Calculate max pages based on page size and max results
         max_pages = min(10, (max_results + self.config.page_size - 1) // self.config.page_size)
         
+        # Search uses offset pagination, so pages can be fetched concurrently
         try:
-            return self.get_paginated(url, params, max_pages=max_pages)
+            return self._run_async(self.get_paginated_async(url, params, max_pages=max_pages))
         except ZendeskAPIError as e:
             if "Search Response Limits" in str(e):
                 logger.warning("Hit Zendesk search response limits, trying with fewer pages")
                 # Retry with fewer pages
                 max_pages = max(1, max_pages // 2)
-                return self.get_paginated(url, params, max_pages=max_pages)
+                return self._run_async(self.get_paginated_async(url, params, max_pages=max_pages))
             else:
                 raise
@@ -0,0 +1,133 @@
+"""
+Tests for extracting email addresses from tickets
+"""
+
+from src.email_extractor import EmailExtractor
+
+
+def _ticket(ticket_id, created_at, requester, **fields):
+    """Build a minimal ticket with a requester email"""
+    return {'id': ticket_id, 'created_at': created_at, 'requester': {'email': requester}, **fields}
+
+
+def test_first_and_last_seen_use_ticket_timestamps():
+    tickets = [
+        _ticket(1, '2024-03-01T00:00:00Z', 'a@example.com'),
+        _ticket(2, '2024-01-15T10:30:00Z', 'a@example.com'),
+        _ticket(3, '2024-02-01T00:00:00Z', 'a@example.com'),
+        _ticket(4, '2024', 'b@example.com'),
+        _ticket(5, None, 'c@example.com')
+    ]
+
+    email_data = EmailExtractor().extract_from_tickets(tickets)
+
+    assert email_data['a@example.com']['first_seen'] == '2024-01-15T10:30:00Z'
+    assert email_data['a@example.com']['last_seen'] == '2024-03-01T00:00:00Z'
+    assert email_data['b@example.com']['first_seen'] == '2024'
+    assert email_data['c@example.com']['first_seen'] is None
+
+
+def _email_entry(ticket_ids, first_seen, last_seen, is_requester=False, is_cc=False, is_from_comment=False):
+    """Build one email's metadata as returned by extract_from_tickets"""
+    return {
+        'ticket_ids': ticket_ids,
+        'ticket_count': len(ticket_ids),
+        'first_seen': first_seen,
+        'last_seen': last_seen,
+        'is_requester': is_requester,
+        'is_cc': is_cc,
+        'is_from_comment': is_from_comment
+    }
+
+
+def test_merge_email_data_combines_entries():
+    merged = EmailExtractor().merge_email_data([
+        {
+            'a@example.com': _email_entry([1, 3], '2024-02-01T00:00:00Z', '2024-03-01T00:00:00Z', is_requester=True),
+            'b@example.com': _email_entry([1], None, None, is_cc=True)
+        },
+        {
+            'a@example.com': _email_entry([2, 3], '2024-01-01T00:00:00Z', '2024-02-15T00:00:00Z', is_cc=True),
+            'b@example.com': _email_entry([4], '2024-05-01T00:00:00Z', '2024-05-01T00:00:00Z', is_from_comment=True)
+        }
+    ])
+
+    assert merged['a@example.com'] == _email_entry(
+        [1, 2, 3], '2024-01-01T00:00:00Z', '2024-03-01T00:00:00Z', is_requester=True, is_cc=True
+    )
+    assert merged['b@example.com'] == _email_entry(
+        [1, 4], '2024-05-01T00:00:00Z', '2024-05-01T00:00:00Z', is_cc=True, is_from_comment=True
+    )
+
+
+def test_extract_from_ticket_groups_matches_single_extraction():
+    groups = [
+        [_ticket(1, '2024-01-01T00:00:00Z', 'a@example.com', email_ccs=['b@example.com'])],
+        [_ticket(2, '2024-02-01T00:00:00Z', 'b@example.com'), _ticket(3, None, 'a@example.com')]
+    ]
+    extractor = EmailExtractor()
+
+    assert extractor.extract_from_ticket_groups(groups) == extractor.extract_from_tickets(
+        ticket for tickets in groups for ticket in tickets
+    )
+
+
+def test_scanned_texts_are_attributed_to_their_ticket(monkeypatch):
+    """Matches in the joined scan buffer map back to the right ticket and source"""
+    # Small enough that tickets 1 and 2 share the first batch and ticket 4
+    # is scanned in a second one
+    monkeypatch.setattr('src.email_extractor._SCAN_BATCH_CHARS', 60)
+    scans = []
+    scan_texts = EmailExtractor._scan_texts
+
+    def counting_scan(self, columns, texts, owners):
+        if texts:
+            scans.append(len(texts))
+        scan_texts(self, columns, texts, owners)
+
+    monkeypatch.setattr(EmailExtractor, '_scan_texts', counting_scan)
+    tickets = [
+        {
+            'id': 1,
+            'custom_fields': [{'value': 'owner: one@example.com'}, {'value': 'no email here'}],
+            'comments': [{'body': 'ping two@example.com'}]
+        },
+        {
+            'id': 2,
+            'fields': [{'value': 'x@'}, {'value': 'three@example.com,two@example.com'}]
+        },
+        {'id': 3, 'comments': [{'body': 'no address'}]},
+        {
+            'id': 4,
+            'custom_fields': [{'value': 'FIVE@Example.com'}],
+            'comments': [{'body': 'from four@example.com'}]
+        }
+    ]
+
+    email_data = EmailExtractor().extract_from_tickets(tickets, include_comments=True)
+
+    assert scans == [4, 2]
+    assert email_data['one@example.com']['ticket_ids'] == [1]
+    assert email_data['two@example.com']['ticket_ids'] == [1, 2]
+    assert email_data['three@example.com']['ticket_ids'] == [2]
+    assert email_data['four@example.com']['ticket_ids'] == [4]
+    assert email_data['five@example.com']['ticket_ids'] == [4]
+    assert email_data['two@example.com']['is_from_comment']
+    assert email_data['four@example.com']['is_from_comment']
+    assert not email_data['one@example.com']['is_from_comment']
+    assert not email_data['three@example.com']['is_from_comment']
+    assert not email_data['five@example.com']['is_from_comment']
+    assert not any(data['is_requester'] or data['is_cc'] for data in email_data.values())
+
+
+def test_adjacent_texts_do_not_join_into_one_match():
+    tickets = [
+        {'id': 1, 'custom_fields': [{'value': 'x@'}] * 6 + [{'value': 'a@b.co'}]},
+        {'id': 2, 'custom_fields': [{'value': 'c@d.co'}, {'value': 'e@f.org'}]}
+    ]
+
+    email_data = EmailExtractor().extract_from_tickets(tickets)
+
+    assert sorted(email_data) == ['a@b.co', 'c@d.co', 'e@f.org']
+    assert email_data['a@b.co']['ticket_ids'] == [1]
+    assert email_data['c@d.co']['ticket_ids'] == [2]
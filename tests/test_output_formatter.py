@@ -0,0 +1,55 @@
+"""
+Tests for exporting extracted email data
+"""
+
+import pandas as pd
+
+from src.output_formatter import OutputFormatter
+
+
+def _email_data(count: int):
+    """Build extractor-shaped email data with distinct ticket counts"""
+    return {
+        f"user{i}@example.com": {
+            'ticket_ids': list(range(1, i + 2)),
+            'ticket_count': i + 1,
+            'first_seen': '2024-01-01T00:00:00Z',
+            'last_seen': '2024-02-01T00:00:00Z',
+            'is_requester': i % 2 == 0,
+            'is_cc': i % 3 == 0,
+            'is_from_comment': False
+        }
+        for i in range(count)
+    }
+
+
+def test_excel_export_round_trip(tmp_path):
+    """Every cell written to the workbook reads back"""
+    email_data = _email_data(8)
+
+    filepath = OutputFormatter(tmp_path).export_emails(email_data, format='excel')
+    sheets = pd.read_excel(filepath, sheet_name=None)
+
+    for name, df in sheets.items():
+        assert not df.isna().any().any(), name
+
+    emails = sheets['Emails']
+    assert len(emails) == 8
+    assert emails['Ticket Count'].tolist() == list(range(8, 0, -1))
+    assert set(emails['Email']) == set(email_data)
+
+    stats = dict(zip(sheets['Statistics']['Metric'], sheets['Statistics']['Value']))
+    assert stats['Total Unique Emails'] == 8
+
+    assert len(sheets['Top Requesters']) == 4
+
+
+def test_excel_export_without_emails(tmp_path):
+    """An empty export still writes the sheets with their headers"""
+    filepath = OutputFormatter(tmp_path).export_emails({}, format='excel')
+    sheets = pd.read_excel(filepath, sheet_name=None)
+
+    assert sheets['Emails'].empty
+    assert 'Ticket Count' in sheets['Emails'].columns
+    stats = dict(zip(sheets['Statistics']['Metric'], sheets['Statistics']['Value']))
+    assert stats['Avg Tickets per Email'] == 0
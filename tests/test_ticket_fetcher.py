@@ -0,0 +1,54 @@
+"""
+Tests for the ticket cache
+"""
+
+import os
+import time
+from datetime import datetime
+
+import pytest
+
+from src.ticket_fetcher import TicketFetcher
+
+
+@pytest.fixture
+def fetcher(tmp_path, monkeypatch):
+    """Fetcher whose cache directory lives in a temporary directory"""
+    monkeypatch.chdir(tmp_path)
+    return TicketFetcher(client=None, config=None)
+
+
+TICKETS = [
+    {
+        'id': 9_007_199_254_740_993,
+        'created_at': '2024-01-15T10:30:00Z',
+        'subject': 'Réunion — 会议',
+        'requester': {'email': 'a@example.com', 'name': None},
+        'email_ccs': ['b@example.com'],
+        'custom_fields': [{'id': 1, 'value': None}, {'id': 2, 'value': 'c@example.com'}],
+        'has_incidents': False,
+        'satisfaction_score': 4.5
+    },
+    {'id': 2, 'tags': []}
+]
+
+
+def test_cache_round_trip(fetcher):
+    cache_key = fetcher._get_cache_key('123', 'open', datetime(2024, 1, 1, 8), None)
+    fetcher._save_to_cache(cache_key, TICKETS)
+
+    assert cache_key.endswith('.msgpack.zst')
+    assert fetcher._load_from_cache(cache_key) == TICKETS
+    assert fetcher._get_cache_key('123', 'open', datetime(2024, 1, 1, 20), None) == cache_key
+    assert fetcher._get_cache_key('123', 'solved', datetime(2024, 1, 1, 8), None) != cache_key
+
+
+def test_expired_or_missing_cache_is_ignored(fetcher):
+    cache_key = fetcher._get_cache_key('123', None, None, None)
+    assert fetcher._load_from_cache(cache_key) is None
+
+    fetcher._save_to_cache(cache_key, TICKETS)
+    stale = time.time() - 7200
+    os.utime(fetcher.cache_dir / cache_key, (stale, stale))
+
+    assert fetcher._load_from_cache(cache_key) is None
@@ -0,0 +1,189 @@
+"""
+Tests for the Zendesk API client
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from config import ZendeskConfig
+from src.zendesk_client import RateLimitExceeded, ZendeskAPIError, ZendeskClient
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Client with test credentials and no backoff delay"""
+    monkeypatch.setenv('ZENDESK_EMAIL', 'agent@example.com')
+    monkeypatch.setenv('ZENDESK_API_TOKEN', 'token')
+    config = ZendeskConfig()
+    config.retry_delay = 0
+    return ZendeskClient(config)
+
+
+def _rate_limited_handler(failures: int):
+    """Mock handler answering 429 `failures` times before succeeding"""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) <= failures:
+            return httpx.Response(429, headers={'Retry-After': '0'})
+        return httpx.Response(200, json={'ok': True})
+
+    return handler, calls
+
+
+def test_rate_limited_request_is_retried(client):
+    handler, calls = _rate_limited_handler(failures=2)
+    client.session = httpx.Client(transport=httpx.MockTransport(handler))
+
+    assert client.get('https://example.zendesk.com/api/v2/groups.json') == {'ok': True}
+    assert len(calls) == 3
+
+
+def test_rate_limit_raises_after_retries(client):
+    handler, calls = _rate_limited_handler(failures=client.config.max_retries + 1)
+    client.session = httpx.Client(transport=httpx.MockTransport(handler))
+
+    with pytest.raises(RateLimitExceeded):
+        client.get('https://example.zendesk.com/api/v2/groups.json')
+    assert len(calls) == client.config.max_retries + 1
+
+
+def test_async_rate_limited_request_is_retried(client):
+    handler, calls = _rate_limited_handler(failures=2)
+
+    async def request():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as session:
+            return await client._make_request_async(
+                session, 'GET', 'https://example.zendesk.com/api/v2/search.json'
+            )
+
+    assert asyncio.run(request()).status_code == 200
+    assert len(calls) == 3
+
+
+def test_search_reuses_async_client(client):
+    created = []
+
+    def handler(request):
+        return httpx.Response(200, json={'results': [{'id': 1}], 'next_page': None})
+
+    def create_async_session():
+        created.append(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        return created[-1]
+
+    client._create_async_session = create_async_session
+
+    assert client.search_tickets('group:1') == [{'id': 1}]
+    assert client.search_tickets('group:2') == [{'id': 1}]
+    assert len(created) == 1
+
+    client.close()
+    assert created[0].is_closed
+
+
+def test_cursor_pagination_follows_next_links(client):
+    requests = []
+    next_url = 'https://example.zendesk.com/api/v2/groups.json?page%5Bafter%5D=abc&page%5Bsize%5D=100'
+
+    def handler(request):
+        requests.append(request)
+        if len(requests) == 1:
+            return httpx.Response(200, json={
+                'groups': [{'id': 1}, {'id': 2}],
+                'meta': {'has_more': True},
+                'links': {'next': next_url}
+            })
+        return httpx.Response(200, json={
+            'groups': [{'id': 3}],
+            'meta': {'has_more': False},
+            'links': {'next': None}
+        })
+
+    client.session = httpx.Client(transport=httpx.MockTransport(handler))
+
+    assert client.get_groups() == [{'id': 1}, {'id': 2}, {'id': 3}]
+    assert len(requests) == 2
+    assert requests[0].url.params['page[size]'] == str(client.config.page_size)
+    assert str(requests[1].url) == next_url
+
+
+def test_offset_pagination_follows_next_page(client):
+    requests = []
+    url = 'https://example.zendesk.com/api/v2/tickets.json'
+
+    def handler(request):
+        requests.append(request)
+        if len(requests) == 1:
+            return httpx.Response(200, json={'tickets': [{'id': 1}], 'next_page': f'{url}?page=2&per_page=100'})
+        return httpx.Response(200, json={'tickets': [{'id': 2}], 'next_page': None})
+
+    client.session = httpx.Client(transport=httpx.MockTransport(handler))
+
+    assert client.get_paginated(url, {'sort_by': 'id'}) == [{'id': 1}, {'id': 2}]
+    assert requests[0].url.params['sort_by'] == 'id'
+    assert str(requests[1].url) == f'{url}?page=2&per_page=100'
+
+
+def test_failed_page_cancels_prefetched_pages(client):
+    async def handler(request):
+        page = int(request.url.params['page'])
+        if page == 1:
+            return httpx.Response(200, json={
+                'results': [{'id': i} for i in range(client.config.page_size)],
+                'count': 10 * client.config.page_size,
+                'next_page': 'https://example.zendesk.com/api/v2/search.json?page=2'
+            })
+        if page == 2:
+            return httpx.Response(400, json={'error': 'bad page'})
+        await asyncio.sleep(10)
+
+    client._create_async_session = lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    with pytest.raises(ZendeskAPIError):
+        client.search_tickets('group:1')
+
+    assert not asyncio.all_tasks(client._thread_state.loop)
+    client.close()
+
+
+def _search_handler(client, total, requests, include_count=True):
+    """Mock search endpoint serving `total` results in pages of page_size"""
+    page_size = client.config.page_size
+
+    def handler(request):
+        page = int(request.url.params['page'])
+        requests.append(page)
+        ids = range((page - 1) * page_size, min(page * page_size, total))
+        data = {
+            'results': [{'id': i} for i in ids],
+            'next_page': 'https://example.zendesk.com/next' if page * page_size < total else None
+        }
+        if include_count:
+            data['count'] = total
+        return httpx.Response(200, json=data)
+
+    return handler
+
+
+@pytest.mark.parametrize('total, pages', [(3, [1]), (250, [1, 2, 3]), (300, [1, 2, 3])])
+def test_search_requests_only_needed_pages(client, total, pages):
+    requests = []
+    handler = _search_handler(client, total, requests)
+    client._create_async_session = lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    assert len(client.search_tickets('group:1')) == total
+    assert sorted(requests) == pages
+    client.close()
+
+
+def test_search_without_count_stops_at_final_page(client):
+    requests = []
+    handler = _search_handler(client, 250, requests, include_count=False)
+    client._create_async_session = lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    assert [ticket['id'] for ticket in client.search_tickets('group:1')] == list(range(250))
+    assert requests[0] == 1
+    client.close()